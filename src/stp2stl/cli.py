@@ -1,154 +1,486 @@
 import argparse
+import functools
 import glob
+import hashlib
+import itertools
 import logging
+import math
 import os
+import shutil
 import sys
+import tempfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import Any, Optional
 
 # --- FreeCAD Path Setup ---
 # Tries to locate the FreeCAD root directory in the following order:
 # 1. FREECAD_PATH environment variable (pointing to the FreeCAD installation root)
 # 2. A hardcoded default path.
 # From the root, it adds the /bin and /lib directories to the Python path.
+# The setup is deferred until FreeCAD is actually needed, so that e.g. '--help' returns instantly.
+# Every worker process of the pool configures itself only once.
 
 FREECAD_ROOT_PATH = None
-FREECAD_PATH_ENV = os.getenv("FREECAD_PATH")
-
-if FREECAD_PATH_ENV and Path(FREECAD_PATH_ENV).is_dir():
-    FREECAD_ROOT_PATH = Path(FREECAD_PATH_ENV)
-    print(f"INFO: Using FreeCAD path from FREECAD_PATH environment variable: {FREECAD_ROOT_PATH}")
-else:
-    # IMPORTANT: This path must point to the root of your FreeCAD installation.
-    default_path = Path(r"C:\Program Files\FreeCAD 1.0")
-    if default_path.is_dir():
-        FREECAD_ROOT_PATH = default_path
-        print(f"INFO: Using default FreeCAD path: {FREECAD_ROOT_PATH}")
-
-if FREECAD_ROOT_PATH and FREECAD_ROOT_PATH.is_dir():
-    bin_path = FREECAD_ROOT_PATH / "bin"
-    lib_path = FREECAD_ROOT_PATH / "lib"
-    mod_path = FREECAD_ROOT_PATH / "Mod"
-    paths_to_add = [str(p) for p in [bin_path, lib_path, mod_path] if p.is_dir()]
-
-    if not paths_to_add:
-        print(f"ERROR: Could not find 'bin' or 'lib' directories in {FREECAD_ROOT_PATH}")
+# The FreeCAD modules, bound by _setup_freecad once FreeCAD is needed
+FreeCAD: Any = None
+Import: Any = None
+MeshPart: Any = None
+Part: Any = None
+_DLL_DIRECTORY_HANDLES: list[Any] = []  # Keeps the added DLL directories registered for the lifetime of the process
+
+
+def _add_dll_directories(root: Path) -> None:
+    """
+    Registers the bin and lib directories of the FreeCAD installation as DLL directories on Windows.
+
+    Python 3.8+ no longer uses sys.path or PATH to resolve the dependent DLLs of the FreeCAD modules
+    (e.g. OpenCascade), so the directories have to be registered explicitly.
+    """
+    if sys.platform != "win32" or not hasattr(os, "add_dll_directory"):
+        return
+    for dll_path in [root / "bin", root / "lib"]:
+        if dll_path.is_dir():
+            _DLL_DIRECTORY_HANDLES.append(os.add_dll_directory(str(dll_path)))
+
+
+def _setup_freecad() -> None:
+    """
+    Locates the FreeCAD installation, extends the Python path and imports the FreeCAD modules.
+    """
+    global FREECAD_ROOT_PATH, FreeCAD, Import, MeshPart, Part
+
+    freecad_path_env = os.getenv("FREECAD_PATH")
+
+    if freecad_path_env and Path(freecad_path_env).is_dir():
+        FREECAD_ROOT_PATH = Path(freecad_path_env)
+        print(f"INFO: Using FreeCAD path from FREECAD_PATH environment variable: {FREECAD_ROOT_PATH}")
+    else:
+        # IMPORTANT: This path must point to the root of your FreeCAD installation.
+        default_path = Path(r"C:\Program Files\FreeCAD 1.0")
+        if default_path.is_dir():
+            FREECAD_ROOT_PATH = default_path
+            print(f"INFO: Using default FreeCAD path: {FREECAD_ROOT_PATH}")
+
+    if FREECAD_ROOT_PATH and FREECAD_ROOT_PATH.is_dir():
+        bin_path = FREECAD_ROOT_PATH / "bin"
+        lib_path = FREECAD_ROOT_PATH / "lib"
+        mod_path = FREECAD_ROOT_PATH / "Mod"
+        paths_to_add = [str(p) for p in [bin_path, lib_path, mod_path] if p.is_dir()]
+
+        if not paths_to_add:
+            print(f"ERROR: Could not find 'bin' or 'lib' directories in {FREECAD_ROOT_PATH}")
+            sys.exit(1)
+
+        for path in paths_to_add:
+            if path not in sys.path:
+                sys.path.append(path)
+
+        _add_dll_directories(FREECAD_ROOT_PATH)
+    else:
+        # Use a simple print for this critical error, as the logger is not yet configured.
+        print("ERROR: Could not find the FreeCAD installation directory.")
+        print("Please do one of the following:")
+        print(
+            "1. Set the 'FREECAD_PATH' environment variable to point to the root directory of your FreeCAD installation."
+        )
+        print(r"   Example: set FREECAD_PATH=C:\Program Files\FreeCAD 0.21")
+        print("2. Modify the 'default_path' variable in this script to the correct location.")
         sys.exit(1)
 
-    for path in paths_to_add:
-        if path not in sys.path:
-            sys.path.append(path)
-else:
-    # Use a simple print for this critical error, as the logger is not yet configured.
-    print("ERROR: Could not find the FreeCAD installation directory.")
-    print("Please do one of the following:")
-    print("1. Set the 'FREECAD_PATH' environment variable to point to the root directory of your FreeCAD installation.")
-    print(r"   Example: set FREECAD_PATH=C:\Program Files\FreeCAD 0.21")
-    print("2. Modify the 'default_path' variable in this script to the correct location.")
-    sys.exit(1)
-
-try:
-    import FreeCAD
-    import Import
-    import MeshPart
-    import Part
-except ImportError:
-    print("ERROR: Could not import the FreeCAD modules.")
-    print(
-        f"Please verify that the path '{FREECAD_ROOT_PATH}' is correct and contains the necessary FreeCAD libraries in its 'bin' and 'lib' subdirectories."
-    )
-    sys.exit(1)
+    try:
+        import FreeCAD
+        import Import
+        import MeshPart
+        import Part
+    except ImportError:
+        print("ERROR: Could not import the FreeCAD modules.")
+        print(
+            f"Please verify that the path '{FREECAD_ROOT_PATH}' is correct and contains the necessary FreeCAD libraries in its 'bin' and 'lib' subdirectories."
+        )
+        sys.exit(1)
+
+
+@functools.lru_cache(maxsize=1)
+def _ensure_freecad() -> bool:
+    """
+    Sets up FreeCAD once per process; calling this function again is cheap.
+    """
+    _setup_freecad()
+    return True
+
+
+def _setup_logging(level: int) -> None:
+    """
+    Configures the logging of the main process and of every worker process.
+    """
+    logging.basicConfig(level=level, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def _init_worker(log_level: int) -> None:
+    """
+    Initializes a worker process: sets up logging and FreeCAD.
+
+    Worker processes which are spawned instead of forked do not inherit the logging configuration.
+    """
+    _setup_logging(log_level)
+    _ensure_freecad()
+
+
+# --- Mesh Settings ---
+# Linear deflection presets relative to the bounding box diagonal of the model. The 'default' preset
+# matches the OpenCascade default deflection of 1e-3 times the diagonal.
+
+QUALITY_PRESETS = {"coarse": 5e-3, "default": 1e-3, "fine": 2e-4}
+
+
+IDENTITY_SCALE = (1.0, 1.0, 1.0)
+MIN_SHAPE_AREA = 1e-12  # Shapes with a smaller area and without solids are considered empty
+
+
+def _standard_mesh_kwargs(args: argparse.Namespace) -> dict:
+    """
+    Returns the MeshPart.meshFromShape arguments for the standard mesher.
+    """
+    return {
+        "LinearDeflection": args.linear_deflection,
+        "AngularDeflection": math.radians(args.angular_deflection),
+        "Relative": True,
+    }
+
+
+def _mefisto_mesh_kwargs(args: argparse.Namespace) -> dict:
+    """
+    Returns the MeshPart.meshFromShape arguments for the Mefisto mesher.
+    """
+    return {"Fineness": args.fineness}
+
+
+def _netgen_mesh_kwargs(args: argparse.Namespace) -> dict:
+    """
+    Returns the MeshPart.meshFromShape arguments for the Netgen mesher.
+    """
+    return {
+        "Fineness": int(args.fineness),
+        "SecondOrder": int(args.second_order),
+        "Optimize": int(args.optimize),
+        "AllowQuad": int(args.allow_quad),
+    }
+
+
+# Builders of the mesher arguments, which are evaluated only once in main
+MESHERS = {
+    "standard": _standard_mesh_kwargs,
+    "mefisto": _mefisto_mesh_kwargs,
+    "netgen": _netgen_mesh_kwargs,
+}
+
+
+@dataclass(frozen=True)
+class MeshParams:
+    """
+    The settings needed to convert a single file, shipped to every worker process.
+    """
+
+    mesher: str
+    mesh_kwargs: tuple[tuple[str, Any], ...]  # Sorted (name, value) pairs, immutable unlike a dict
+    relative_deflection: Optional[float]
+    scale: tuple[float, float, float]
+    use_document: bool
+    use_cache: bool
+    force: bool
+
+
+# --- Mesh Cache ---
+# Meshed STL files are stored in a cache directory, keyed by the content of the STEP file and the
+# mesh parameters. The location can be changed with the STP2STL_CACHE environment variable.
+
+# The settings are stored in the (otherwise unused) 80 byte header of every binary STL file, so a
+# rerun with other settings does not skip the conversion of an STL file that is newer than its STEP file.
+
+CACHE_CHUNK_SIZE = 1 << 20  # Read STEP files in 1 MiB chunks while hashing
+EMPTY_BINARY_STL_SIZE = 84  # 80 byte header plus the triangle count, so an STL of this size has no triangles
+STL_HEADER_SIZE = 80
+SETTINGS_HEADER_PREFIX = b"stp2stl settings "  # Must not start with 'solid', which marks an ASCII STL file
+
+
+def _settings_key(params: MeshParams) -> str:
+    """
+    Returns a digest of the settings that determine the mesh.
+    """
+    mesh_params = asdict(params)
+    # Whether the cache is used or the conversion is forced does not change the mesh
+    del mesh_params["use_cache"]
+    del mesh_params["force"]
+    return hashlib.blake2b(repr(sorted(mesh_params.items())).encode(), digest_size=16).hexdigest()
+
+
+def _cache_path(input_filepath: str, params: MeshParams) -> Path:
+    """
+    Returns the path of the cached STL file belonging to a STEP file and its mesh parameters.
+    """
+    hasher = hashlib.blake2b()
+    with open(input_filepath, "rb") as step_file:
+        for chunk in iter(lambda: step_file.read(CACHE_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    hasher.update(_settings_key(params).encode())
+
+    cache_dir = Path(os.getenv("STP2STL_CACHE", Path.home() / ".cache" / "stp2stl"))
+    return cache_dir / (hasher.hexdigest()[:16] + ".stl")
+
+
+def _store_in_cache(output_filepath: str, cached_filepath: Path) -> None:
+    """
+    Copies an STL file into the cache.
+
+    The file is first written to a temporary file and then moved into place, so other workers or a
+    crash never leave a partially written file under the cached name.
+    """
+    cached_filepath.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=cached_filepath.parent, suffix=".tmp", delete=False) as tmp_file:
+        tmp_filepath = tmp_file.name
+    try:
+        shutil.copyfile(output_filepath, tmp_filepath)
+        os.replace(tmp_filepath, cached_filepath)
+    except BaseException:
+        os.remove(tmp_filepath)
+        raise
+
+
+def _is_up_to_date(input_filepath: str, output_filepath: str, settings_key: str) -> bool:
+    """
+    Returns True if the STL file is newer than the STEP file, has triangles and was made with the same settings.
+    """
+    if not (
+        os.path.exists(output_filepath)
+        and os.path.getmtime(output_filepath) >= os.path.getmtime(input_filepath)
+        and os.path.getsize(output_filepath) > EMPTY_BINARY_STL_SIZE
+    ):
+        return False
+    with open(output_filepath, "rb") as stl_file:
+        return stl_file.read(STL_HEADER_SIZE) == _settings_header(settings_key)
+
+
+def _settings_header(settings_key: str) -> bytes:
+    """
+    Returns the binary STL header recording the settings a file was made with.
+    """
+    return (SETTINGS_HEADER_PREFIX + settings_key.encode()).ljust(STL_HEADER_SIZE)
+
+
+def _write_settings_header(stl_filepath: str, settings_key: str) -> None:
+    """
+    Overwrites the header of a binary STL file with the settings it was made with.
+    """
+    with open(stl_filepath, "r+b") as stl_file:
+        stl_file.write(_settings_header(settings_key))
+
 
 # --- Conversion Function ---
 
 
-def convert_step_to_stl(
-    input_filepath: str,
-    scale_x: float,
-    scale_y: float,
-    scale_z: float,
-    args: argparse.Namespace,
-):
+def _output_filepath(input_filepath: str) -> str:
     """
-    Converts a single STEP file to STL with specific mesh settings.
+    Returns the path of the STL file written for a STEP file.
     """
-    output_filepath = os.path.splitext(input_filepath)[0] + ".stl"
-    doc = None  # Initialize doc to None for the finally block
+    return os.path.splitext(input_filepath)[0] + ".stl"
 
-    logging.info(f"Processing file: {input_filepath}...")
 
+def _try_reuse_output(
+    input_filepath: str,
+    output_filepath: str,
+    params: MeshParams,
+    settings_key: str,
+) -> tuple[bool, Optional[Path]]:
+    """
+    Checks whether the STL file is up to date or can be copied from the mesh cache.
+
+    Returns whether the STL file can be reused, and the cache path to store a new mesh under (None
+    if the cache is not used).
+    """
+    # Skip files of which the STL file is newer than the STEP file and made with the same settings
+    if not params.force and _is_up_to_date(input_filepath, output_filepath, settings_key):
+        logging.info("Up-to-date, skipping: %s", output_filepath)
+        return True, None
+
+    # 0. Reuse a previously meshed STL file if the input and settings did not change
+    if not params.use_cache:
+        return False, None
+    # Problems with the cache (e.g. a read-only home directory) must never fail the conversion
     try:
-        # 1. Create a new document and import the STEP file into it.
-        doc = FreeCAD.newDocument()
+        cached_filepath = _cache_path(input_filepath, params)
+        if not cached_filepath.exists():
+            return False, cached_filepath
+        shutil.copyfile(cached_filepath, output_filepath)
+    except OSError:
+        logging.warning("Could not read the mesh cache for %s", input_filepath, exc_info=True)
+        return False, None
+    _write_settings_header(output_filepath, settings_key)
+    logging.info("Using cached mesh: %s", cached_filepath)
+    logging.info("File successfully converted: %s", output_filepath)
+    return True, cached_filepath
+
+
+def _read_shape(input_filepath: str, doc: Any) -> Any:
+    """
+    Reads the shape of a STEP file, via the given FreeCAD document or directly if doc is None.
+    """
+    if doc is not None:
+        # 1. Import the STEP file into the document.
         Import.insert(input_filepath, doc.Name)
 
         # Check if any object was imported
         if not doc.Objects:
-            raise RuntimeError("STEP file could not be imported or is empty.")  # noqa: TRY003, TRY301
+            raise RuntimeError("STEP file could not be imported or is empty.")  # noqa: TRY003
 
         # 2. Get the shape from the first imported object.
         # This assumes the STEP file contains at least one object.
         shape = doc.Objects[0].Shape
+    else:
+        # 1./2. Read the shape directly, without the overhead of a FreeCAD document.
+        shape = Part.read(input_filepath)
+
+    # Do not spend time on meshing an empty shape, as found in some malformed STEP files. The area is
+    # an integral over all faces, so it is only computed for shapes without solids.
+    if shape.isNull() or (not shape.Solids and shape.Area < MIN_SHAPE_AREA):
+        raise RuntimeError("STEP file contains an empty shape.")  # noqa: TRY003
+    return shape
+
+
+def convert_step_to_stl(input_filepath: str, params: MeshParams) -> bool:
+    """
+    Converts a single STEP file to STL with specific mesh settings.
+
+    Returns True if the STL file was written, False otherwise.
+    """
+    _ensure_freecad()
+
+    output_filepath = _output_filepath(input_filepath)
+    settings_key = _settings_key(params)
+    doc = None  # Initialize doc to None for the finally block
+
+    logging.info("Processing file: %s...", input_filepath)
+
+    try:
+        reused, cached_filepath = _try_reuse_output(input_filepath, output_filepath, params, settings_key)
+        if reused:
+            return True
+
+        # 1./2. Read the shape, via a new document if requested
+        if params.use_document:
+            doc = FreeCAD.newDocument()
+        shape = _read_shape(input_filepath, doc)
 
         # 3. Create the Mesh (Tessellation)
-        logging.info(f"Performing meshing with '{args.mesher}' mesher...")
-        if args.mesher == "standard":
-            angular_deflection_rad = args.angular_deflection * (3.141592653589793 / 180.0)
-            logging.debug(
-                f"Running standard mesher with LinearDeflection={args.linear_deflection}, AngularDeflection={angular_deflection_rad}"
-            )
-            mesh_object = MeshPart.meshFromShape(
-                Shape=shape,
-                LinearDeflection=args.linear_deflection,
-                AngularDeflection=angular_deflection_rad,
-                Relative=True,
-            )
-        elif args.mesher == "mefisto":
-            mesh_object = MeshPart.meshFromShape(
-                Shape=shape,
-                Fineness=args.fineness,
-            )
-        elif args.mesher == "netgen":
-            fineness = int(args.fineness)
-            second_order = int(args.second_order)
-            optimize = int(args.optimize)
-            allow_quad = int(args.allow_quad)
-            logging.debug(
-                f"Netgen parameters: fineness={fineness}, second_order={second_order}, optimize={optimize}, allow_quad={allow_quad}"
-            )
-            mesh_object = MeshPart.meshFromShape(
-                Shape=shape,
-                Fineness=fineness,
-                SecondOrder=second_order,
-                Optimize=optimize,
-                AllowQuad=allow_quad,
-            )
-
-        else:
-            # This should not happen due to 'choices' in argparse
-            raise ValueError(f"Unknown mesher: {args.mesher}")  # noqa: TRY003, TRY301
-
-        # 4. Apply scaling if necessary
-        if scale_x != 1.0 or scale_y != 1.0 or scale_z != 1.0:
-            logging.info(f"Applying scaling: x={scale_x}, y={scale_y}, z={scale_z}")
+        logging.info("Performing meshing with '%s' mesher...", params.mesher)
+        mesh_kwargs = dict(params.mesh_kwargs)
+        if params.relative_deflection is not None:
+            # Scale the deflection with the size of the model (bounding box diagonal). main has already
+            # switched the mesher to absolute deflections for this.
+            linear_deflection = params.relative_deflection * shape.BoundBox.DiagonalLength
+            mesh_kwargs["LinearDeflection"] = linear_deflection
+            logging.debug("Relative linear deflection: %s", linear_deflection)
+        mesh_object = MeshPart.meshFromShape(Shape=shape, **mesh_kwargs)
+
+        # 4. Apply scaling if necessary. The mesh is scaled in place after meshing, so the shape is never
+        # copied and the deflection settings keep referring to the original model units.
+        if params.scale != IDENTITY_SCALE:
+            scale_x, scale_y, scale_z = params.scale
+            logging.info("Applying scaling: x=%s, y=%s, z=%s", scale_x, scale_y, scale_z)
             matrix = FreeCAD.Base.Matrix(scale_x, 0, 0, 0, 0, scale_y, 0, 0, 0, 0, scale_z, 0, 0, 0, 0, 1)
             mesh_object.transform(matrix)
 
         # 5. Export to STL
-        logging.info(f"Exporting to: {output_filepath}...")
-        mesh_object.write(output_filepath)
+        logging.info("Exporting to: %s...", output_filepath)
+        # Pin the binary STL format ('AST' would be ASCII), which is much smaller and faster to write
+        mesh_object.write(Filename=output_filepath, Format="STL")
+        _write_settings_header(output_filepath, settings_key)
 
-        logging.info(f"File successfully converted: {output_filepath}")
+        if cached_filepath is not None:
+            try:
+                _store_in_cache(output_filepath, cached_filepath)
+            except OSError:
+                # The STL file is written, so a cache problem does not fail the conversion
+                logging.warning("Could not store %s in the mesh cache", output_filepath, exc_info=True)
+
+        logging.info("File successfully converted: %s", output_filepath)
 
     except Exception:
         # Use logging.exception to include traceback information in the log
-        logging.exception(f"Could not convert file {input_filepath}")
+        logging.exception("Could not convert file %s", input_filepath)
+        return False
 
     finally:
         # 6. Clean up by closing the document to free up memory
         if doc:
-            logging.info(f"Closing document: {doc.Name}")
+            logging.info("Closing document: %s", doc.Name)
             FreeCAD.closeDocument(doc.Name)
 
+    return True
+
+
+MAX_WINDOWS_JOBS = 61  # ProcessPoolExecutor refuses more workers on Windows
+STEP_SUFFIXES = frozenset({".stp", ".step"})
+
+
+def _candidate_paths(patterns: list) -> Iterator[str]:
+    """
+    Lazily expands the glob patterns given on the command line.
+    """
+    for pattern in patterns:
+        matched = False
+        for filepath in glob.iglob(pattern, recursive=True):
+            matched = True
+            yield filepath
+        if not matched:
+            logging.warning("No files matched the pattern: %s", pattern)
+
+
+def _unique_paths(paths: Iterable[str]) -> Iterator[str]:
+    """
+    Yields each file only once, in first-seen order, even if it is matched by several patterns or via a symlink.
+    """
+    seen = set()
+    for filepath in paths:
+        key = os.path.normcase(os.path.realpath(filepath))
+        if key in seen:
+            continue
+        seen.add(key)
+        yield filepath
+
+
+def _valid_step_files(paths: Iterable[str]) -> Iterator[str]:
+    """
+    Yields the existing STEP files from the given paths, skipping all others.
+    """
+    for filepath in paths:
+        if not os.path.exists(filepath):
+            logging.warning("File not found, skipping: %s", filepath)
+            continue
+
+        # Check if it is a STEP file, only lowering the extension instead of the full path
+        if os.path.splitext(filepath)[1].lower() not in STEP_SUFFIXES:
+            logging.warning("File is not a .stp or .step file, skipping: %s", filepath)
+            continue
+
+        yield filepath
+
+
+def _unique_outputs(paths: Iterable[str]) -> Iterator[str]:
+    """
+    Skips STEP files which would write the same STL file as an earlier one, e.g. 'part.stp' and 'part.step'.
+    """
+    outputs: dict[str, str] = {}
+    for filepath in paths:
+        key = os.path.normcase(os.path.realpath(_output_filepath(filepath)))
+        if key in outputs:
+            logging.warning("Output file of %s is already written for %s, skipping", filepath, outputs[key])
+            continue
+        outputs[key] = filepath
+        yield filepath
+
 
 # --- Main Execution ---
 
@@ -158,7 +490,7 @@ def main():
     Main function for parsing arguments and calling the conversion.
     """
     # Setup logging
-    logging.basicConfig(level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s")
+    _setup_logging(logging.DEBUG)
 
     # Setup argument parser
     parser = argparse.ArgumentParser(description="Convert one or more STEP (.stp, .step) files to STL (.stl).")
@@ -175,13 +507,33 @@ def main():
     parser.add_argument(
         "--mm_to_m", action="store_true", help="Apply a uniform scaling factor of 0.001 to convert from mm to m."
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Number of files to convert in parallel, each in its own process. Default is the number of CPU cores (at most 61 on Windows).",
+    )
+    parser.add_argument(
+        "--no_cache",
+        action="store_true",
+        help="Do not read or write the mesh cache (located by the STP2STL_CACHE environment variable).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Convert all files, also if the STL file is newer than the STEP file and was made with the same settings.",
+    )
+    parser.add_argument(
+        "--use_document",
+        action="store_true",
+        help="Import the STEP file into a FreeCAD document and mesh its first object instead of reading the shape directly.",
+    )
     # Mesh settings
     mesher_group = parser.add_argument_group("Meshing settings")
     mesher_group.add_argument(
         "--mesher",
         type=str,
         default="standard",
-        choices=["standard", "mefisto", "netgen"],
+        choices=list(MESHERS),
         help="Meshing algorithm to use. Default is 'standard'.",
     )
 
@@ -199,6 +551,18 @@ def main():
         default=5,
         help="Angular deflection for meshing in degrees (for 'standard' mesher). Default is 5 degrees.",
     )
+    standard_group.add_argument(
+        "--relative_deflection",
+        type=float,
+        metavar="RATIO",
+        help="Absolute linear deflection as a ratio of the bounding box diagonal of the model, instead of relative to the edge lengths (for 'standard' mesher). Overrides --linear_deflection.",
+    )
+    standard_group.add_argument(
+        "--quality",
+        type=str,
+        choices=list(QUALITY_PRESETS),
+        help="Relative deflection preset (for 'standard' mesher): coarse=5e-3, default=1e-3, fine=2e-4 times the bounding box diagonal. 'default' is the OpenCascade default, not the default of this tool, which is --linear_deflection. Ignored if --relative_deflection is given.",
+    )
 
     # Mefisto mesher settings
     mefisto_group = parser.add_argument_group("Mefisto mesher settings")
@@ -248,6 +612,15 @@ def main():
         help="Elements per curvature radius for Netgen mesher (0.2 to 10, larger is finer). Default is 2.0.",
     )
     args = parser.parse_args()
+    if args.mesher != "standard" and (args.relative_deflection is not None or args.quality is not None):
+        parser.error("--relative_deflection and --quality are only supported by the 'standard' mesher")
+
+    # Only set up FreeCAD after the arguments are parsed, so '--help' and argument errors do not need it.
+    # Failing here avoids starting the worker processes without a FreeCAD installation.
+    _ensure_freecad()
+
+    if args.relative_deflection is None and args.quality is not None:
+        args.relative_deflection = QUALITY_PRESETS[args.quality]
 
     # Determine scaling factors
     if args.mm_to_m:
@@ -265,36 +638,47 @@ def main():
     if args.scale_z is not None:
         scale_z = args.scale_z
 
-    # Expand glob patterns
-    all_files = []
-    for pattern in args.input_files:
-        expanded_files = glob.glob(pattern, recursive=True)
-        if not expanded_files:
-            logging.warning(f"No files matched the pattern: {pattern}")
-        all_files.extend(expanded_files)
-
-    # Loop over all found files
-    logging.info(f"Number of files to convert: {len(all_files)}")
-    success_count = 0
-    for filepath in all_files:
-        if not os.path.exists(filepath):
-            logging.warning(f"File not found, skipping: {filepath}")
-            continue
+    # The mesher arguments are built once here instead of for every file
+    mesh_kwargs = MESHERS[args.mesher](args)
+    relative_deflection = args.relative_deflection
+    if relative_deflection is not None:
+        # The linear deflection is filled in per file from the bounding box of the shape. It is an
+        # absolute length, so OpenCascade must not multiply it with the edge lengths again.
+        del mesh_kwargs["LinearDeflection"]
+        mesh_kwargs["Relative"] = False
+        logging.debug(
+            "Running %s mesher with %s and LinearDeflection=%s times the bounding box diagonal",
+            args.mesher,
+            mesh_kwargs,
+            relative_deflection,
+        )
+    else:
+        logging.debug("Running %s mesher with %s", args.mesher, mesh_kwargs)
+
+    # Only the settings needed for the conversion are sent to the workers. The scaling options are
+    # combined into one final scale, so the mesh is transformed at most once.
+    params = MeshParams(
+        mesher=args.mesher,
+        mesh_kwargs=tuple(sorted(mesh_kwargs.items())),
+        relative_deflection=relative_deflection,
+        scale=(scale_x, scale_y, scale_z),
+        use_document=args.use_document,
+        use_cache=not args.no_cache,
+        force=args.force,
+    )
 
-        # Check if it is a STEP file
-        if filepath.lower().endswith((".stp", ".step")):
-            convert_step_to_stl(
-                filepath,
-                scale_x,
-                scale_y,
-                scale_z,
-                args,
-            )
-            success_count += 1
-        else:
-            logging.warning(f"File is not a .stp or .step file, skipping: {filepath}")
-
-    logging.info(f"Done. {success_count} out of {len(all_files)} files processed.")
+    # Convert the files in parallel, each worker process sets up FreeCAD once
+    # The glob patterns are expanded lazily, so the first files are converted while the rest is still found.
+    jobs = max(1, args.jobs or os.cpu_count() or 1)
+    if sys.platform == "win32":
+        jobs = min(jobs, MAX_WINDOWS_JOBS)
+    filepaths = _unique_outputs(_valid_step_files(_unique_paths(_candidate_paths(args.input_files))))
+    worker_init_args = (logging.getLogger().level,)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=worker_init_args) as executor:
+        results = list(executor.map(convert_step_to_stl, filepaths, itertools.repeat(params), chunksize=4))
+    success_count = sum(results)
+
+    logging.info("Done. %d out of %d files processed.", success_count, len(results))
 
 
 if __name__ == "__main__":
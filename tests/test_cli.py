@@ -0,0 +1,218 @@
+import os
+
+import pytest
+
+from stp2stl import cli
+from stp2stl.cli import (
+    EMPTY_BINARY_STL_SIZE,
+    MeshParams,
+    _cache_path,
+    _candidate_paths,
+    _is_up_to_date,
+    _settings_key,
+    _store_in_cache,
+    _try_reuse_output,
+    _unique_outputs,
+    _unique_paths,
+    _valid_step_files,
+    _write_settings_header,
+    convert_step_to_stl,
+)
+
+
+def make_params(**changes):
+    settings = {
+        "mesher": "standard",
+        "mesh_kwargs": (("AngularDeflection", 0.1), ("LinearDeflection", 10.0), ("Relative", True)),
+        "relative_deflection": None,
+        "scale": (1.0, 1.0, 1.0),
+        "use_document": False,
+        "use_cache": True,
+        "force": False,
+    }
+    settings.update(changes)
+    return MeshParams(**settings)
+
+
+def make_converted_file(tmp_path, settings_key, stl_size=EMPTY_BINARY_STL_SIZE + 50):
+    step_file = tmp_path / "part.stp"
+    step_file.write_text("ISO-10303-21;")
+    stl_file = tmp_path / "part.stl"
+    stl_file.write_bytes(b"\0" * stl_size)
+    _write_settings_header(str(stl_file), settings_key)
+    os.utime(step_file, (1000, 1000))
+    os.utime(stl_file, (2000, 2000))
+    return str(step_file), str(stl_file)
+
+
+@pytest.fixture
+def step_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("STP2STL_CACHE", str(tmp_path / "cache"))
+    step_file = tmp_path / "part.stp"
+    step_file.write_text("ISO-10303-21;")
+    return str(step_file)
+
+
+def test_mesh_params_are_hashable():
+    assert hash(make_params()) == hash(make_params())
+
+
+def test_cache_path_is_in_cache_dir(tmp_path, step_file):
+    cached = _cache_path(step_file, make_params())
+    assert cached.parent == tmp_path / "cache"
+    assert cached.suffix == ".stl"
+    assert cached == _cache_path(step_file, make_params())
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"mesher": "netgen"},
+        {"mesh_kwargs": (("AngularDeflection", 0.1), ("LinearDeflection", 2.0), ("Relative", True))},
+        {"relative_deflection": 1e-3},
+        {"scale": (0.001, 0.001, 0.001)},
+        {"use_document": True},
+    ],
+)
+def test_cache_path_changes_with_mesh_settings(step_file, changes):
+    assert _cache_path(step_file, make_params(**changes)) != _cache_path(step_file, make_params())
+
+
+@pytest.mark.parametrize("changes", [{"use_cache": False}, {"force": True}])
+def test_cache_path_ignores_run_options(step_file, changes):
+    assert _cache_path(step_file, make_params(**changes)) == _cache_path(step_file, make_params())
+
+
+def test_cache_path_changes_with_step_content(step_file):
+    cached = _cache_path(step_file, make_params())
+    with open(step_file, "a") as file:
+        file.write("END-ISO-10303-21;")
+    assert _cache_path(step_file, make_params()) != cached
+
+
+def test_store_in_cache(tmp_path):
+    stl_file = tmp_path / "part.stl"
+    stl_file.write_bytes(b"solid")
+    cached = tmp_path / "cache" / "0123456789abcdef.stl"
+    _store_in_cache(str(stl_file), cached)
+    assert cached.read_bytes() == b"solid"
+    assert [path.name for path in cached.parent.iterdir()] == [cached.name]
+
+
+def test_unreadable_cache_entry_is_not_reused(tmp_path, step_file):
+    params = make_params()
+    # A directory under the cached file name cannot be copied
+    _cache_path(step_file, params).mkdir(parents=True)
+    output_file = str(tmp_path / "part.stl")
+    assert _try_reuse_output(step_file, output_file, params, _settings_key(params)) == (False, None)
+    assert not os.path.exists(output_file)
+
+
+class FakeShape:
+    Solids = (object(),)
+
+    def isNull(self):
+        return False
+
+
+class FakeMesh:
+    def write(self, Filename, Format):
+        with open(Filename, "wb") as file:
+            file.write(b"\0" * (EMPTY_BINARY_STL_SIZE + 50))
+
+
+@pytest.fixture
+def fake_freecad(monkeypatch):
+    monkeypatch.setattr(cli, "_ensure_freecad", lambda: True)
+    monkeypatch.setattr(
+        cli, "Part", type("Part", (), {"read": staticmethod(lambda filepath: FakeShape())}), raising=False
+    )
+    monkeypatch.setattr(
+        cli,
+        "MeshPart",
+        type("MeshPart", (), {"meshFromShape": staticmethod(lambda **kwargs: FakeMesh())}),
+        raising=False,
+    )
+
+
+def test_cache_failure_does_not_fail_conversion(tmp_path, step_file, fake_freecad, monkeypatch):
+    (tmp_path / "blocked").write_text("")
+    monkeypatch.setenv("STP2STL_CACHE", str(tmp_path / "blocked"))
+    params = make_params()
+    assert convert_step_to_stl(step_file, params)
+    assert _is_up_to_date(step_file, str(tmp_path / "part.stl"), _settings_key(params))
+
+
+def test_up_to_date_with_same_settings(tmp_path):
+    key = _settings_key(make_params())
+    step_file, stl_file = make_converted_file(tmp_path, key)
+    assert _is_up_to_date(step_file, stl_file, key)
+
+
+def test_not_up_to_date_with_other_settings(tmp_path):
+    step_file, stl_file = make_converted_file(tmp_path, _settings_key(make_params()))
+    other_key = _settings_key(make_params(scale=(0.001, 0.001, 0.001)))
+    assert not _is_up_to_date(step_file, stl_file, other_key)
+
+
+def test_not_up_to_date_when_step_file_is_newer(tmp_path):
+    key = _settings_key(make_params())
+    step_file, stl_file = make_converted_file(tmp_path, key)
+    os.utime(step_file, (3000, 3000))
+    assert not _is_up_to_date(step_file, stl_file, key)
+
+
+def test_settings_header_keeps_stl_size(tmp_path):
+    _, stl_file = make_converted_file(tmp_path, _settings_key(make_params()))
+    assert os.path.getsize(stl_file) == EMPTY_BINARY_STL_SIZE + 50
+    assert sorted(os.listdir(tmp_path)) == ["part.stl", "part.stp"]
+
+
+def test_not_up_to_date_for_empty_stl(tmp_path):
+    key = _settings_key(make_params())
+    step_file, stl_file = make_converted_file(tmp_path, key, stl_size=EMPTY_BINARY_STL_SIZE)
+    assert not _is_up_to_date(step_file, stl_file, key)
+
+
+def test_unique_outputs_skips_colliding_stl_files(tmp_path):
+    paths = [str(tmp_path / "part.stp"), str(tmp_path / "part.step"), str(tmp_path / "other.stp")]
+    assert list(_unique_outputs(paths)) == [paths[0], paths[2]]
+
+
+@pytest.fixture
+def step_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "sub").mkdir()
+    for name in ["a.stp", "b.STEP", "sub/c.step", "notes.txt"]:
+        (tmp_path / name).write_text("")
+    return tmp_path
+
+
+def test_candidate_paths_expands_patterns_recursively(step_dir):
+    assert sorted(_candidate_paths(["**/*.st*p"])) == sorted(["a.stp", os.path.join("sub", "c.step")])
+
+
+def test_candidate_paths_warns_for_unmatched_pattern(step_dir, caplog):
+    assert list(_candidate_paths(["*.igs"])) == []
+    assert "No files matched the pattern: *.igs" in caplog.text
+
+
+def test_unique_paths_removes_overlapping_patterns(step_dir):
+    paths = _candidate_paths(["a.stp", "*.stp", "./a.stp", "**/*.stp"])
+    assert list(_unique_paths(paths)) == ["a.stp"]
+
+
+def test_unique_paths_keeps_first_seen_path(step_dir):
+    paths = ["sub/c.step", "a.stp", "sub/../sub/c.step", str(step_dir / "a.stp")]
+    assert list(_unique_paths(paths)) == ["sub/c.step", "a.stp"]
+
+
+def test_unique_paths_removes_symlinks(step_dir):
+    (step_dir / "link.stp").symlink_to(step_dir / "a.stp")
+    assert list(_unique_paths(["a.stp", "link.stp"])) == ["a.stp"]
+    assert list(_unique_paths(["link.stp", "a.stp"])) == ["link.stp"]
+
+
+def test_valid_step_files(step_dir):
+    paths = ["a.stp", "b.STEP", "notes.txt", "missing.stp"]
+    assert list(_valid_step_files(paths)) == ["a.stp", "b.STEP"]